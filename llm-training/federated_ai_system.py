@@ -13,23 +13,54 @@ Features:
 - Human-in-the-loop validation
 """
 
+import bisect
+import collections
+import functools
+import math
+import operator
+import sys
+import time
 import numpy as np
 import torch
 import torch.nn as nn
 from typing import Dict, List, Optional, Tuple, Any
 import json
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
-import pandas as pd
-from sklearn.metrics import accuracy_score, precision_score, recall_score
-import matplotlib.pyplot as plt
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+G = 6.67430e-11  # Gravitational constant (m³/kg/s²)
+SIGMA = 5.670374419e-8  # Stefan-Boltzmann constant (W/m²/K⁴)
+
+# Explanation lookup tables: a value strictly above thresholds[i] maps to messages[i + 1]
+_REASONING_THRESHOLDS = (0.3, 0.5, 0.7)
+_REASONING_MESSAGES = (
+    "Not an exoplanet - signal characteristics inconsistent with planetary transit",
+    "Weak candidate - signal present but likely false positive",
+    "Potential exoplanet - some indicators present but require validation",
+    "Strong exoplanet candidate - multiple indicators align with planetary signals",
+)
+_SIGNAL_QUALITY_THRESHOLDS = (5, 10)
+_SIGNAL_QUALITY_MESSAGES = (
+    "Low signal quality - requires careful validation",
+    "Moderate signal quality - good candidate",
+    "High signal-to-noise ratio - reliable detection",
+)
+
+@functools.lru_cache(maxsize=4096)
+def _orbital_distance_cached(star_mass: float, period: float) -> float:
+    """Memoized Kepler distance for a (stellar mass, period in days) pair"""
+    period_seconds = period * 24 * 3600
+    return ((G * star_mass * period_seconds**2) / (4 * math.pi**2))**(1/3)
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ExoplanetCandidate:
     """Represents a potential exoplanet candidate with measurements"""
     star_id: str
@@ -44,9 +75,10 @@ class ExoplanetCandidate:
     temperature: Optional[float] = None
     
     def to_dict(self):
-        return asdict(self)
+        # Fields are all scalars, so skip asdict's recursive deep copy
+        return {field.name: getattr(self, field.name) for field in fields(self)}
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AIHelperResult:
     """Results from an AI helper's analysis"""
     helper_id: str
@@ -69,11 +101,10 @@ class ScientificCalculator:
         Calculate radial velocity amplitude from planet parameters
         Formula: K = (2πG/P)^(1/3) * (Mp*sin(i)/(Ms + Mp)^(2/3))
         """
-        G = 6.67430e-11  # Gravitational constant
         period_seconds = period * 24 * 3600
         
-        K = ((2 * np.pi * G / period_seconds)**(1/3) * 
-             (planet_mass * np.sin(np.radians(inclination))) / 
+        K = ((2 * math.pi * G / period_seconds)**(1/3) * 
+             (planet_mass * math.sin(math.radians(inclination))) / 
              ((star_mass + planet_mass)**(2/3)))
         
         return K
@@ -91,11 +122,15 @@ class ScientificCalculator:
         Calculate orbital distance using Kepler's 3rd law
         P² = (4π²/GM) * a³
         """
-        G = 6.67430e-11  # m³/kg/s²
-        period_seconds = period * 24 * 3600
-        
-        a = ((G * star_mass * period_seconds**2) / (4 * np.pi**2))**(1/3)
-        return a
+        # Rounded keys let re-analyzed stars hit the cache despite float noise
+        return _orbital_distance_cached(round(star_mass, 6), round(period, 6))
+    
+    @staticmethod
+    def orbital_distance_batch(star_mass: np.ndarray, period: np.ndarray) -> np.ndarray:
+        """Element-wise orbital_distance over arrays of stellar masses and periods"""
+        period_seconds = np.asarray(period, dtype=np.float64) * (24 * 3600)
+        return np.cbrt(G * np.asarray(star_mass, dtype=np.float64) * period_seconds**2 /
+                       (4 * np.pi**2))
     
     @staticmethod
     def stellar_luminosity(star_radius: float, temperature: float) -> float:
@@ -103,56 +138,82 @@ class ScientificCalculator:
         Calculate stellar luminosity using Stefan-Boltzmann law
         L = 4πRs²σT⁴
         """
-        sigma = 5.670374419e-8  # Stefan-Boltzmann constant
-        return 4 * np.pi * star_radius**2 * sigma * temperature**4
+        return 4 * math.pi * star_radius**2 * SIGMA * temperature**4
+    
+    @staticmethod
+    def stellar_luminosity_batch(star_radius: np.ndarray, temperature: np.ndarray) -> np.ndarray:
+        """Element-wise stellar_luminosity over arrays of radii and temperatures"""
+        star_radius = np.asarray(star_radius, dtype=np.float64)
+        temperature = np.asarray(temperature, dtype=np.float64)
+        return 4 * np.pi * star_radius**2 * SIGMA * temperature**4
 
 class AIHelper:
     """
     Individual AI helper that processes astronomical data locally
     """
     
+    # Feature backbone shared by every helper - each helper only owns a small head
+    _shared_backbone = nn.Sequential(
+        nn.Linear(10, 64),  # 10 input features
+        nn.ReLU(),
+        nn.Linear(64, 32),
+        nn.ReLU()
+    )
+    
     def __init__(self, helper_id: str, specialization: str = "general"):
         self.helper_id = helper_id
         self.specialization = specialization  # e.g., "transit", "radial_velocity", "imaging"
         self.reliability_weight = 1.0
-        self.performance_history = []
-        self.model = self._initialize_model()
+        self.performance_history = collections.deque(maxlen=10)  # Last 10 outcomes
+        self._recent_correct = 0
+        self.feedback_count = 0
+        # Reusable (1, 10) model input row - 10 input features
+        self._feature_buffer = np.empty((1, 10), dtype=np.float32, order='C')
+        self._feature_importance = np.full(10, 0.1, dtype=np.float32)  # Neutral prior
+        self.head = self._initialize_head()
         self.calculator = ScientificCalculator()
         
-    def _initialize_model(self) -> nn.Module:
-        """Initialize a simple neural network for exoplanet classification"""
-        model = nn.Sequential(
-            nn.Linear(10, 64),  # 10 input features
-            nn.ReLU(),
-            nn.Dropout(0.3),
-            nn.Linear(64, 32),
-            nn.ReLU(),
-            nn.Dropout(0.3),
-            nn.Linear(32, 16),
-            nn.ReLU(),
-            nn.Linear(16, 1),
-            nn.Sigmoid()
-        )
-        return model
+    def _initialize_head(self) -> nn.Linear:
+        """Initialize this helper's classification head on top of the shared backbone"""
+        return nn.Linear(32, 1)
     
     def analyze_data(self, data: Dict[str, Any]) -> AIHelperResult:
         """
         Analyze astronomical data and return prediction with explanation
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        
+        # Physical quantities shared by feature extraction and explanation
+        derived = self._derive_quantities(data)
         
         # Extract features from input data
-        features = self._extract_features(data)
+        features = self._extract_features(data, derived)
+        
+        # Make prediction, keeping the graph for input-gradient attribution
+        inputs = torch.from_numpy(self._feature_buffer).requires_grad_(True)  # Zero-copy view
+        output = torch.sigmoid(self.head(self._shared_backbone(inputs)))
+        prediction = output.item()
         
-        # Make prediction
-        with torch.no_grad():
-            inputs = torch.tensor(features, dtype=torch.float32).unsqueeze(0)
-            prediction = self.model(inputs).item()
+        # A saturated sigmoid has exactly zero gradient, so skip the backward pass
+        if 0.0 < prediction < 1.0:
+            gradients = torch.autograd.grad(output, inputs)[0][0].numpy()
+        else:
+            gradients = np.zeros(10, dtype=np.float32)
         
+        return self._build_result(data, features, prediction, gradients, start_time, derived)
+    
+    def _build_result(self, data: Dict[str, Any], features: np.ndarray, prediction: float,
+                      gradients: np.ndarray, start_time: float,
+                      derived: Dict[str, float], shared_time: float = 0.0) -> AIHelperResult:
+        """Wrap a raw model prediction with its explanation and timing
+
+        ``shared_time`` is this result's share of work done outside the call,
+        such as the batched forward pass, and is added to ``processing_time``.
+        """
         # Generate explanation
-        explanation = self._generate_explanation(data, features, prediction)
+        explanation = self._generate_explanation(data, features, prediction, gradients, derived)
         
-        processing_time = (datetime.now() - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time + shared_time
         
         return AIHelperResult(
             helper_id=self.helper_id,
@@ -164,44 +225,115 @@ class AIHelper:
             timestamp=datetime.now()
         )
     
-    def _extract_features(self, data: Dict[str, Any]) -> List[float]:
-        """Extract numerical features from raw astronomical data"""
-        features = []
+    def _derive_quantities(self, data: Dict[str, Any]) -> Dict[str, float]:
+        """Compute each derived physical quantity once per candidate"""
+        derived = {}
+        if 'period' in data and 'stellar_mass' in data:
+            derived['orbital_distance'] = self.calculator.orbital_distance(
+                data['stellar_mass'], data['period']
+            )
+        return derived
+    
+    def _extract_features(self, data: Dict[str, Any], derived: Dict[str, float]) -> np.ndarray:
+        """
+        Extract numerical features from raw astronomical data
+        
+        The returned array is a view of the helper's reusable feature buffer
+        and is overwritten by the next call.
+        """
+        features = self._feature_buffer[0]
         
         # Basic transit features
-        features.append(data.get('period', 0.0))
-        features.append(data.get('depth', 0.0))
-        features.append(data.get('duration', 0.0))
-        features.append(data.get('stellar_mass', 1.0))
-        features.append(data.get('stellar_radius', 1.0))
-        features.append(data.get('temperature', 5777.0))
+        features[0] = data.get('period', 0.0)
+        features[1] = data.get('depth', 0.0)
+        features[2] = data.get('duration', 0.0)
+        features[3] = data.get('stellar_mass', 1.0)
+        features[4] = data.get('stellar_radius', 1.0)
+        features[5] = data.get('temperature', 5777.0)
         
         # Calculated features using scientific formulas
-        if 'period' in data and 'stellar_mass' in data:
-            orbital_distance = self.calculator.orbital_distance(
-                data['stellar_mass'], data['period']
-            )
-            features.append(orbital_distance)
-        else:
-            features.append(0.0)
+        features[6] = derived.get('orbital_distance', 0.0)
         
-        # Transit depth ratio
+        # Transit depth ratio (approximates radius ratio); NaN for negative
+        # depths from noisy photometry, matching np.sqrt in the batch path
         if 'depth' in data:
-            features.append(np.sqrt(data['depth']))  # Approximates radius ratio
+            depth = data['depth']
+            features[7] = math.sqrt(depth) if depth >= 0 else math.nan
         else:
-            features.append(0.0)
+            features[7] = 0.0
         
         # Normalized period (log scale)
         if 'period' in data and data['period'] > 0:
-            features.append(np.log10(data['period']))
+            features[8] = math.log10(data['period'])
         else:
-            features.append(0.0)
+            features[8] = 0.0
         
         # Transit signal-to-noise ratio (simplified)
-        snr = data.get('depth', 0) / max(data.get('noise', 0.001), 0.001)
-        features.append(snr)
+        features[9] = data.get('depth', 0) / max(data.get('noise', 0.001), 0.001)
         
-        return features[:10]  # Ensure exactly 10 features
+        return features
+    
+    def _extract_features_batch(self, datas) -> Tuple[np.ndarray, List[Dict[str, float]]]:
+        """
+        Extract features for many candidates into a single (N, 10) float32 matrix
+        
+        Accepts a list of data dicts or a pandas DataFrame with the same column
+        names; every feature is computed column-wise, matching _extract_features.
+        Also returns each candidate's derived quantities, as _derive_quantities
+        would build them, taken from the same float64 columns.
+        """
+        columns = self._feature_columns(datas, (
+            'period', 'depth', 'duration', 'stellar_mass', 'stellar_radius',
+            'temperature', 'noise'
+        ))
+        has_period = ~np.isnan(columns['period'])
+        has_stellar_mass = ~np.isnan(columns['stellar_mass'])
+        
+        period = np.where(has_period, columns['period'], 0.0)
+        depth = np.nan_to_num(columns['depth'], nan=0.0)
+        stellar_mass = np.where(has_stellar_mass, columns['stellar_mass'], 1.0)
+        noise = np.nan_to_num(columns['noise'], nan=0.001)
+        
+        features = np.empty((len(period), 10), dtype=np.float32)
+        
+        # Basic transit features
+        features[:, 0] = period
+        features[:, 1] = depth
+        features[:, 2] = np.nan_to_num(columns['duration'], nan=0.0)
+        features[:, 3] = stellar_mass
+        features[:, 4] = np.nan_to_num(columns['stellar_radius'], nan=1.0)
+        features[:, 5] = np.nan_to_num(columns['temperature'], nan=5777.0)
+        
+        # Calculated features using scientific formulas
+        has_orbit = has_period & has_stellar_mass
+        orbital_distance = np.where(has_orbit,
+                                    self.calculator.orbital_distance_batch(stellar_mass, period), 0.0)
+        features[:, 6] = orbital_distance
+        features[:, 7] = np.sqrt(depth)  # Approximates radius ratio
+        features[:, 8] = np.log10(period, out=np.zeros_like(period), where=period > 0)
+        features[:, 9] = depth / np.maximum(noise, 0.001)
+        
+        derived_quantities = [
+            {'orbital_distance': distance} if present else {}
+            for distance, present in zip(orbital_distance.tolist(), has_orbit.tolist())
+        ]
+        
+        return features, derived_quantities
+    
+    @staticmethod
+    def _feature_columns(datas, keys: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+        """Gather raw measurements as float64 columns, NaN where a value is missing"""
+        n = len(datas)
+        if hasattr(datas, 'columns'):  # pandas DataFrame
+            return {
+                key: (datas[key].to_numpy(dtype=np.float64, na_value=np.nan)
+                      if key in datas.columns else np.full(n, np.nan))
+                for key in keys
+            }
+        return {
+            key: np.fromiter((data.get(key, np.nan) for data in datas), dtype=np.float64, count=n)
+            for key in keys
+        }
     
     def _get_feature_names(self) -> List[str]:
         """Return names of features used by the model"""
@@ -211,12 +343,13 @@ class AIHelper:
             'log_period', 'signal_to_noise'
         ]
     
-    def _generate_explanation(self, data: Dict[str, Any], features: List[float], 
-                            prediction: float) -> Dict[str, Any]:
+    def _generate_explanation(self, data: Dict[str, Any], features: np.ndarray, 
+                            prediction: float, gradients: np.ndarray,
+                            derived: Dict[str, float]) -> Dict[str, Any]:
         explanation = {
             'prediction_reasoning': self._get_prediction_reasoning(prediction),
-            'key_factors': self._identify_key_factors(features, prediction),
-            'scientific_analysis': self._scientific_analysis(data),
+            'key_factors': self._identify_key_factors(gradients),
+            'scientific_analysis': self._scientific_analysis(data, derived),
             'confidence_factors': self._confidence_analysis(features),
             'specialization_notes': self._specialization_notes(data)
         }
@@ -224,25 +357,19 @@ class AIHelper:
     
     def _get_prediction_reasoning(self, prediction: float) -> str:
         """Provide human-readable reasoning for the prediction"""
-        if prediction > 0.7:
-            return "Strong exoplanet candidate - multiple indicators align with planetary signals"
-        elif prediction > 0.5:
-            return "Potential exoplanet - some indicators present but require validation"
-        elif prediction > 0.3:
-            return "Weak candidate - signal present but likely false positive"
-        else:
-            return "Not an exoplanet - signal characteristics inconsistent with planetary transit"
+        return _REASONING_MESSAGES[bisect.bisect_left(_REASONING_THRESHOLDS, prediction)]
     
-    def _identify_key_factors(self, features: List[float], prediction: float) -> Dict[str, float]:
-
-        feature_names = self._get_feature_names()
-
-        importance = np.random.rand(len(features))  # Placeholder
-        importance = importance / np.sum(importance)
+    def _identify_key_factors(self, gradients: np.ndarray) -> Dict[str, float]:
+        """Rank features by the magnitude of the prediction's gradient w.r.t. each input"""
+        importance = np.abs(gradients)
+        total = importance.sum()
         
-        return {name: float(imp) for name, imp in zip(feature_names, importance)}
+        # A saturated output has no gradient signal - fall back to the neutral prior
+        importance = importance / total if total > 0 else self._feature_importance
+        
+        return dict(zip(self._get_feature_names(), importance.tolist()))
     
-    def _scientific_analysis(self, data: Dict[str, Any]) -> Dict[str, str]:
+    def _scientific_analysis(self, data: Dict[str, Any], derived: Dict[str, float]) -> Dict[str, str]:
         """Provide scientific analysis based on detection methods"""
         analysis = {}
         
@@ -253,25 +380,22 @@ class AIHelper:
             else:
                 analysis['transit_method'] = "Transit depth too shallow for reliable detection"
         
-        if 'stellar_mass' in data and 'period' in data:
+        if 'orbital_distance' in derived:
             # Orbital characteristics
-            orbital_dist = self.calculator.orbital_distance(data['stellar_mass'], data['period'])
+            orbital_dist = derived['orbital_distance']
             analysis['orbital_analysis'] = f"Orbital distance: {orbital_dist/1.496e11:.2f} AU"
         
         return analysis
     
-    def _confidence_analysis(self, features: List[float]) -> Dict[str, str]:
+    def _confidence_analysis(self, features: np.ndarray) -> Dict[str, str]:
         """Analyze factors affecting prediction confidence"""
         analysis = {}
         
         # Signal-to-noise analysis
         snr = features[-1]  # Last feature is SNR
-        if snr > 10:
-            analysis['signal_quality'] = "High signal-to-noise ratio - reliable detection"
-        elif snr > 5:
-            analysis['signal_quality'] = "Moderate signal quality - good candidate"
-        else:
-            analysis['signal_quality'] = "Low signal quality - requires careful validation"
+        analysis['signal_quality'] = _SIGNAL_QUALITY_MESSAGES[
+            bisect.bisect_left(_SIGNAL_QUALITY_THRESHOLDS, snr)
+        ]
         
         return analysis
     
@@ -288,14 +412,17 @@ class AIHelper:
     
     def update_reliability(self, feedback: bool, ground_truth: bool):
         """Update reliability weight based on human feedback"""
-        self.performance_history.append({
-            'prediction_correct': feedback == ground_truth,
-            'timestamp': datetime.now()
-        })
+        prediction_correct = feedback == ground_truth
+        
+        # Keep a running count of correct outcomes in the window
+        if len(self.performance_history) == self.performance_history.maxlen:
+            self._recent_correct -= self.performance_history[0]
+        self.performance_history.append(prediction_correct)
+        self._recent_correct += prediction_correct
+        self.feedback_count += 1
         
         # Calculate recent accuracy
-        recent_performance = self.performance_history[-10:]  # Last 10 predictions
-        accuracy = sum(p['prediction_correct'] for p in recent_performance) / len(recent_performance)
+        accuracy = self._recent_correct / len(self.performance_history)
         
         # Update reliability weight (exponential moving average)
         self.reliability_weight = 0.8 * self.reliability_weight + 0.2 * accuracy
@@ -307,13 +434,34 @@ class FederatedAISystem:
     
     def __init__(self):
         self.helpers: Dict[str, AIHelper] = {}
-        self.aggregation_history = []
+        self.aggregation_history = []  # Per-analysis inputs, results and explanations
         self.human_feedback_log = []
         
+        # Feedback outcomes and the predictions they judged, for vectorized stats
+        self._feedback_count = 0
+        self._feedback_bool = np.empty(0, dtype=bool)
+        self._feedback_predictions = np.empty(0, dtype=np.float64)
+        
+        # Numeric history stored column-wise: one row per (analysis, helper) pair,
+        # with analysis a owning rows _history_offsets[a]:_history_offsets[a + 1]
+        self._history_count = 0
+        self._history_rows = 0
+        self._history_offsets = np.zeros(1, dtype=np.int64)
+        self._history_timestamps = np.empty(0, dtype=np.float64)
+        self._history_consensus = np.empty(0, dtype=np.float64)
+        self._history_helper_idx = np.empty(0, dtype=np.int32)
+        self._history_predictions = np.empty(0, dtype=np.float32)
+        self._history_confidences = np.empty(0, dtype=np.float32)
+        self._history_processing_times = np.empty(0, dtype=np.float32)
+        
+        # Helper ids in federation order
+        self._helper_ids: List[str] = []
+        
     def add_helper(self, helper_id: str, specialization: str = "general"):
         """Add a new AI helper to the federation"""
         helper = AIHelper(helper_id, specialization)
         self.helpers[helper_id] = helper
+        self._helper_ids = list(self.helpers)
         logger.info(f"Added AI helper: {helper_id} (specialization: {specialization})")
     
     def analyze_candidate(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -322,123 +470,230 @@ class FederatedAISystem:
         """
         logger.info(f"Analyzing candidate: {data.get('star_id', 'unknown')}")
         
-        # Get predictions from all helpers
-        helper_results = {}
-        for helper_id, helper in self.helpers.items():
-            result = helper.analyze_data(data)
-            helper_results[helper_id] = result
+        return self.analyze_candidate_batch([data])[0]
+    
+    def analyze_candidate_batch(self, datas) -> List[Dict[str, Any]]:
+        """
+        Analyze many candidates at once, running each helper's model a single
+        time over the whole (N_candidates, 10) feature batch
         
-        # Aggregate predictions using reliability weighting
-        aggregated_result = self._aggregate_predictions(helper_results)
+        Accepts a list of data dicts or a pandas DataFrame with one candidate
+        per row; missing (NaN) DataFrame cells are treated as absent keys.
         
-        # Store for history
+        Each result's processing_time is its own explanation time plus an even
+        share of the batched feature extraction and model pass.
+        """
+        if not self.helpers:
+            raise ValueError("No AI helpers in the federation - call add_helper first")
+        if hasattr(datas, 'columns'):  # pandas DataFrame
+            datas = [
+                {key: value for key, value in record.items()
+                 if not (isinstance(value, float) and math.isnan(value))}
+                for record in datas.to_dict('records')
+            ]
+        if len(datas) == 0:
+            return []
+        
+        start_time = time.perf_counter()
+        helpers = list(self.helpers.values())
+        
+        # Features do not depend on the helper, so extract them once
+        features, derived_quantities = helpers[0]._extract_features_batch(datas)
+        
+        predictions, gradients = self._predict_batch(features)
+        batch_share = (time.perf_counter() - start_time) / len(datas)
+        
+        aggregated_results = []
+        for data, row, derived, candidate_predictions, candidate_gradients in zip(
+                datas, features, derived_quantities, predictions, gradients):
+            # Scatter the batched outputs back into per-helper results
+            helper_results = {
+                helper.helper_id: helper._build_result(data, row, prediction, gradient,
+                                                       time.perf_counter(), derived,
+                                                       shared_time=batch_share)
+                for helper, prediction, gradient in zip(helpers, candidate_predictions,
+                                                        candidate_gradients)
+            }
+            
+            # Aggregate predictions using reliability weighting
+            aggregated_result = self._aggregate_predictions(helper_results)
+            
+            self._record_analysis(data, helper_results, aggregated_result)
+            aggregated_results.append(aggregated_result)
+        
+        return aggregated_results
+    
+    def _record_analysis(self, data: Dict[str, Any], helper_results: Dict[str, AIHelperResult],
+                         aggregated_result: Dict[str, Any]):
+        """Append an analysis to the numeric history columns and the explanation log"""
+        analysis_id = self._history_count
+        start = self._history_rows
+        stop = start + len(helper_results)
+        
+        self._history_offsets = self._ensure_capacity(self._history_offsets, analysis_id + 2)
+        self._history_timestamps = self._ensure_capacity(self._history_timestamps, analysis_id + 1)
+        self._history_consensus = self._ensure_capacity(self._history_consensus, analysis_id + 1)
+        self._history_helper_idx = self._ensure_capacity(self._history_helper_idx, stop)
+        self._history_predictions = self._ensure_capacity(self._history_predictions, stop)
+        self._history_confidences = self._ensure_capacity(self._history_confidences, stop)
+        self._history_processing_times = self._ensure_capacity(self._history_processing_times, stop)
+        
+        self._history_offsets[analysis_id + 1] = stop
+        self._history_timestamps[analysis_id] = time.time()
+        self._history_consensus[analysis_id] = aggregated_result['consensus_strength']
+        
+        # helper_results follow the federation order
+        for row, result in enumerate(helper_results.values(), start):
+            self._history_predictions[row] = result.prediction
+            self._history_confidences[row] = result.confidence
+            self._history_processing_times[row] = result.processing_time
+        self._history_helper_idx[start:stop] = np.arange(len(helper_results))
+        
+        self._history_count = analysis_id + 1
+        self._history_rows = stop
+        
+        # Heavyweight explanations stay out of the numeric columns
         self.aggregation_history.append({
-            'timestamp': datetime.now(),
             'input_data': data,
-            'helper_results': helper_results,
-            'aggregated_result': aggregated_result
+            'aggregated_result': aggregated_result,
+            'helper_explanations': {helper_id: result.explanation
+                                    for helper_id, result in helper_results.items()}
         })
+    
+    @staticmethod
+    def _ensure_capacity(array: np.ndarray, size: int) -> np.ndarray:
+        """Return an array holding at least size entries, doubling its capacity as needed"""
+        if size <= len(array):
+            return array
+        grown = np.empty(max(size, 2 * len(array)), dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+    
+    def _predict_batch(self, features: np.ndarray) -> Tuple[List[List[float]], np.ndarray]:
+        """
+        Run the shared backbone and every helper head in a single batched pass,
+        returning [candidate][helper] predictions and their input gradients
+        with shape (N_candidates, N_helpers, 10)
+        """
+        heads = [helper.head for helper in self.helpers.values()]
+        n_helpers, n_candidates = len(heads), len(features)
+        
+        # Give each helper its own copy of the batch so that a single backward
+        # pass yields every helper's per-candidate input gradients
+        inputs = torch.from_numpy(np.ascontiguousarray(features, dtype=np.float32))
+        inputs = inputs.repeat(n_helpers, 1).requires_grad_(True)
+        
+        hidden = AIHelper._shared_backbone(inputs).view(n_helpers, n_candidates, -1)
+        weight = torch.cat([head.weight for head in heads], dim=0)
+        bias = torch.cat([head.bias for head in heads], dim=0)
+        outputs = torch.sigmoid(torch.einsum('hnk,hk->hn', hidden, weight) + bias[:, None])
+        
+        # A saturated sigmoid has exactly zero gradient, so skip the backward
+        # pass when no output is strictly between 0 and 1
+        if ((outputs > 0) & (outputs < 1)).any():
+            gradients = torch.autograd.grad(outputs.sum(), inputs)[0]
+            gradients = gradients.view(n_helpers, n_candidates, -1).transpose(0, 1).numpy()
+        else:
+            gradients = np.zeros((n_candidates, n_helpers, features.shape[1]), dtype=np.float32)
         
-        return aggregated_result
+        return outputs.detach().T.tolist(), gradients
     
     def _aggregate_predictions(self, helper_results: Dict[str, AIHelperResult]) -> Dict[str, Any]:
         """
         Aggregate predictions using the feedback-based knowledge weighting formula:
         P = Σ(wi * pi) / Σ(wi)
-        """
-        weighted_prediction = 0.0
-        total_weight = 0.0
-        explanations = {}
         
-        for helper_id, result in helper_results.items():
-            weight = self.helpers[helper_id].reliability_weight
-            weighted_prediction += weight * result.prediction
-            total_weight += weight
-            explanations[helper_id] = result.explanation
-        
-        # Calculate final aggregated prediction
-        final_prediction = weighted_prediction / total_weight if total_weight > 0 else 0.5
-        
-        # Aggregate explanations
-        aggregated_explanation = self._aggregate_explanations(explanations, helper_results)
-        
-        return {
-            'prediction': final_prediction,
-            'confidence': self._calculate_aggregate_confidence(helper_results),
-            'explanation': aggregated_explanation,
-            'individual_results': {k: {'prediction': v.prediction, 'confidence': v.confidence} 
-                                 for k, v in helper_results.items()},
-            'helper_weights': {k: v.reliability_weight for k, v in self.helpers.items()},
-            'consensus_strength': self._calculate_consensus(helper_results)
-        }
-    
-    def _aggregate_explanations(self, explanations: Dict[str, Dict], 
-                              helper_results: Dict[str, AIHelperResult]) -> Dict[str, Any]:
-        """
-        Aggregate explanations from multiple helpers using weighted approach:
+        Explanations are aggregated in the same pass using the weighted approach:
         E(t) = Σ(wi * ei(t)) / Σ(wi)
         """
-        # Combine prediction reasoning
+        # Read weights fresh so direct changes to reliability_weight are honored
+        weights = np.fromiter(
+            (self.helpers[helper_id].reliability_weight for helper_id in helper_results),
+            dtype=np.float64, count=len(helper_results)
+        )
+        predictions = np.empty(len(helper_results), dtype=np.float64)
+        confidences = np.empty(len(helper_results), dtype=np.float64)
+        
         reasoning_votes = {}
-        for helper_id, explanation in explanations.items():
+        factor_sums = {}
+        confidence_factors = {}
+        individual_results = {}
+        individual_analyses = {}
+        specialization_insights = {}
+        
+        # Running mean and sum of squared deviations (Welford's algorithm)
+        mean = 0.0
+        m2 = 0.0
+        
+        for i, (helper_id, result) in enumerate(helper_results.items()):
+            weight = weights[i]
+            explanation = result.explanation
+            predictions[i] = result.prediction
+            confidences[i] = result.confidence
+            individual_results[helper_id] = {'prediction': result.prediction,
+                                             'confidence': result.confidence}
+            
+            # Update the running prediction spread
+            delta = result.prediction - mean
+            mean += delta / (i + 1)
+            m2 += delta * (result.prediction - mean)
+            
+            # Combine prediction reasoning
             reasoning = explanation['prediction_reasoning']
-            weight = self.helpers[helper_id].reliability_weight
             reasoning_votes[reasoning] = reasoning_votes.get(reasoning, 0) + weight
-        
-        primary_reasoning = max(reasoning_votes.items(), key=lambda x: x[1])[0]
-        
-        # Aggregate key factors
-        aggregated_factors = {}
-        total_weight = sum(self.helpers[h].reliability_weight for h in explanations.keys())
-        
-        for helper_id, explanation in explanations.items():
-            weight = self.helpers[helper_id].reliability_weight / total_weight
+            
+            # Accumulate weighted key factors
             for factor, importance in explanation['key_factors'].items():
-                aggregated_factors[factor] = aggregated_factors.get(factor, 0) + weight * importance
+                factor_sums[factor] = factor_sums.get(factor, 0) + weight * importance
+            
+            # Collect confidence analysis from all helpers
+            for factor, analysis in explanation['confidence_factors'].items():
+                confidence_factors.setdefault(factor, []).append(f"{helper_id}: {analysis}")
+            
+            individual_analyses[helper_id] = explanation['scientific_analysis']
+            specialization_insights[helper_id] = explanation['specialization_notes']
         
-        return {
-            'primary_reasoning': primary_reasoning,
-            'aggregated_factors': aggregated_factors,
-            'individual_analyses': {k: v['scientific_analysis'] for k, v in explanations.items()},
-            'confidence_consensus': self._aggregate_confidence_factors(explanations),
-            'specialization_insights': {k: v['specialization_notes'] for k, v in explanations.items()}
+        # Calculate final aggregated prediction
+        total_weight = weights.sum()
+        final_prediction = float(predictions @ weights / total_weight) if total_weight > 0 else 0.5
+        
+        n_helpers = len(helper_results)
+        std_dev = math.sqrt(m2 / n_helpers) if n_helpers else 0.0
+        consensus = self._calculate_consensus(std_dev, n_helpers)
+        
+        aggregated_explanation = {
+            'primary_reasoning': max(reasoning_votes.items(), key=operator.itemgetter(1))[0],
+            'aggregated_factors': {factor: float(total / total_weight)
+                                   for factor, total in factor_sums.items()},
+            'individual_analyses': individual_analyses,
+            'confidence_consensus': {factor: "; ".join(analyses)
+                                     for factor, analyses in confidence_factors.items()},
+            'specialization_insights': specialization_insights
         }
-    
-    def _aggregate_confidence_factors(self, explanations: Dict[str, Dict]) -> Dict[str, str]:
-        """Aggregate confidence analysis from all helpers"""
-        confidence_factors = {}
-        for helper_id, explanation in explanations.items():
-            for factor, analysis in explanation['confidence_factors'].items():
-                if factor not in confidence_factors:
-                    confidence_factors[factor] = []
-                confidence_factors[factor].append(f"{helper_id}: {analysis}")
         
-        return {factor: "; ".join(analyses) for factor, analyses in confidence_factors.items()}
+        return {
+            'prediction': final_prediction,
+            'confidence': self._calculate_aggregate_confidence(confidences, weights, consensus),
+            'explanation': aggregated_explanation,
+            'individual_results': individual_results,
+            'helper_weights': {k: v.reliability_weight for k, v in self.helpers.items()},
+            'consensus_strength': consensus
+        }
     
-    def _calculate_aggregate_confidence(self, helper_results: Dict[str, AIHelperResult]) -> float:
+    def _calculate_aggregate_confidence(self, confidences: np.ndarray, weights: np.ndarray,
+                                        consensus_factor: float) -> float:
         """Calculate overall confidence considering individual confidences and consensus"""
-        confidences = [result.confidence for result in helper_results.values()]
-        weights = [self.helpers[helper_id].reliability_weight 
-                  for helper_id in helper_results.keys()]
-        
         # Weighted average confidence
-        weighted_confidence = sum(c * w for c, w in zip(confidences, weights)) / sum(weights)
+        weighted_confidence = float(confidences @ weights / weights.sum())
         
         # Adjust for consensus (higher consensus = higher confidence)
-        consensus_factor = self._calculate_consensus(helper_results)
-        
         return min(1.0, weighted_confidence * (0.7 + 0.3 * consensus_factor))
     
-    def _calculate_consensus(self, helper_results: Dict[str, AIHelperResult]) -> float:
-        """Calculate how much the helpers agree (0-1 scale)"""
-        predictions = [result.prediction for result in helper_results.values()]
-        
-        if len(predictions) <= 1:
+    def _calculate_consensus(self, std_dev: float, n_helpers: int) -> float:
+        """Calculate how much the helpers agree (0-1 scale) from the prediction spread"""
+        if n_helpers <= 1:
             return 1.0
         
-        # Calculate standard deviation of predictions
-        std_dev = np.std(predictions)
-        
         # Convert to consensus score (lower std = higher consensus)
         consensus = max(0.0, 1.0 - 2 * std_dev)  # Normalize assuming max std ~0.5
         
@@ -450,10 +705,14 @@ class FederatedAISystem:
         Provide human feedback on a prediction and update helper reliability
         This implements the feedback-based knowledge weighting system
         """
-        if analysis_id >= len(self.aggregation_history):
+        if not -self._history_count <= analysis_id < self._history_count:
             logger.error(f"Invalid analysis ID: {analysis_id}")
             return
         
+        # Negative ids count back from the latest analysis, as with list indexing
+        if analysis_id < 0:
+            analysis_id += self._history_count
+        
         analysis = self.aggregation_history[analysis_id]
         
         # Log feedback
@@ -466,15 +725,23 @@ class FederatedAISystem:
         }
         self.human_feedback_log.append(feedback_entry)
         
+        n = self._feedback_count
+        self._feedback_bool = self._ensure_capacity(self._feedback_bool, n + 1)
+        self._feedback_predictions = self._ensure_capacity(self._feedback_predictions, n + 1)
+        self._feedback_bool[n] = is_correct
+        self._feedback_predictions[n] = feedback_entry['prediction']
+        self._feedback_count = n + 1
+        
         # Update individual helper reliability using gradient descent approach
         # wi ← wi - η∂L/∂wi where L = -h*log(P) - (1-h)*log(1-P)
         learning_rate = 0.1
         
-        for helper_id, result in analysis['helper_results'].items():
-            helper = self.helpers[helper_id]
+        start, stop = self._history_offsets[analysis_id:analysis_id + 2]
+        for helper_idx, prediction in zip(self._history_helper_idx[start:stop].tolist(),
+                                          self._history_predictions[start:stop].tolist()):
+            helper = self.helpers[self._helper_ids[helper_idx]]
             
             # Calculate binary cross-entropy loss gradient
-            prediction = result.prediction
             h = 1.0 if is_correct else 0.0  # Human feedback as ground truth
             
             # Avoid log(0) by clipping
@@ -496,11 +763,11 @@ class FederatedAISystem:
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get current status and statistics of the federated system"""
-        total_analyses = len(self.aggregation_history)
-        total_feedback = len(self.human_feedback_log)
+        total_analyses = self._history_count
+        total_feedback = self._feedback_count
         
         # Calculate accuracy from feedback
-        correct_predictions = sum(1 for f in self.human_feedback_log if f['human_feedback'])
+        correct_predictions = int(self._feedback_bool[:total_feedback].sum())
         accuracy = correct_predictions / total_feedback if total_feedback > 0 else 0.0
         
         # Helper statistics
@@ -509,7 +776,7 @@ class FederatedAISystem:
             helper_stats[helper_id] = {
                 'reliability_weight': helper.reliability_weight,
                 'specialization': helper.specialization,
-                'performance_history_length': len(helper.performance_history)
+                'performance_history_length': helper.feedback_count
             }
         
         return {
@@ -518,31 +785,28 @@ class FederatedAISystem:
             'system_accuracy': accuracy,
             'helper_count': len(self.helpers),
             'helper_statistics': helper_stats,
-            'recent_consensus_scores': [
-                self._calculate_consensus(analysis['helper_results']) 
-                for analysis in self.aggregation_history[-10:]
-            ]
+            'recent_consensus_scores': self._history_consensus[
+                max(0, total_analyses - 10):total_analyses
+            ].tolist()
         }
     
     def visualize_performance(self, save_path: Optional[str] = None):
         """Create visualization of system performance over time"""
-        if not self.human_feedback_log:
+        if self._feedback_count == 0:
             logger.warning("No feedback data available for visualization")
             return
         
+        # Imported lazily so that plotting support is only loaded when used
+        import matplotlib.pyplot as plt
+        
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
         # Accuracy over time
-        timestamps = [f['timestamp'] for f in self.human_feedback_log]
-        cumulative_accuracy = []
-        correct_count = 0
-        
-        for i, feedback in enumerate(self.human_feedback_log):
-            if feedback['human_feedback']:
-                correct_count += 1
-            cumulative_accuracy.append(correct_count / (i + 1))
+        n = self._feedback_count
+        cumulative_accuracy = (np.cumsum(self._feedback_bool[:n], dtype=np.float32) /
+                               np.arange(1, n + 1, dtype=np.float32))
         
-        ax1.plot(range(len(cumulative_accuracy)), cumulative_accuracy)
+        ax1.plot(np.arange(n), cumulative_accuracy)
         ax1.set_title('System Accuracy Over Time')
         ax1.set_xlabel('Feedback Count')
         ax1.set_ylabel('Accuracy')
@@ -559,20 +823,18 @@ class FederatedAISystem:
         plt.setp(ax2.get_xticklabels(), rotation=45, ha="right")
         
         # Consensus scores over time
-        consensus_scores = [
-            self._calculate_consensus(analysis['helper_results']) 
-            for analysis in self.aggregation_history[-50:]  # Last 50 analyses
+        consensus_scores = self._history_consensus[
+            max(0, self._history_count - 50):self._history_count  # Last 50 analyses
         ]
         
-        ax3.plot(range(len(consensus_scores)), consensus_scores)
+        ax3.plot(np.arange(len(consensus_scores)), consensus_scores)
         ax3.set_title('Consensus Strength Over Time')
         ax3.set_xlabel('Analysis Number')
         ax3.set_ylabel('Consensus Score')
         ax3.grid(True)
         
         # Prediction distribution
-        predictions = [f['prediction'] for f in self.human_feedback_log]
-        ax4.hist(predictions, bins=20, alpha=0.7)
+        ax4.hist(self._feedback_predictions[:n], bins=20, alpha=0.7)
         ax4.set_title('Distribution of Predictions')
         ax4.set_xlabel('Prediction Value')
         ax4.set_ylabel('Frequency')